@@ -5,6 +5,9 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 
 from service import Service
+from sources import TicketSource, DatabaseSource, FileSource, HttpSource
+from query import QueryExecutor
+from snapshot import SnapshotStore
 from typing import Optional, Literal, List
 from schemas import PaginatedResponse, Ticket, TicketStats
 from starlette.status import HTTP_404_NOT_FOUND, HTTP_500_INTERNAL_SERVER_ERROR
@@ -15,6 +18,7 @@ from slowapi.middleware import SlowAPIMiddleware
 from slowapi.errors import RateLimitExceeded
 from models import *
 
+import asyncio
 import os
 
 
@@ -26,10 +30,18 @@ async def lifespan(app: FastAPI):
 
     app.state.engine = engine
     app.state.SessionLocal = SessionLocal
-    app.state.service = Service(db_session_factory=SessionLocal)
+    app.state.service = Service(db_session_factory=SessionLocal, sources=build_sources(SessionLocal),
+                                executor=app.state.executor, store=SnapshotStore(SNAPSHOT_PATH))
+
+    # serve the snapshot from the previous run while sources are refreshed in the background
+    await app.state.service.sources.restore()
+    refresh = asyncio.create_task(app.state.service.sources.refresh())
 
     yield
 
+    refresh.cancel()
+    await app.state.service.sources.close()
+    app.state.executor.shutdown()
     engine.dispose()
 
 
@@ -43,16 +55,40 @@ app.state.limiter = Limiter(key_func=get_remote_address, default_limits=["5/minu
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 app.add_middleware(SlowAPIMiddleware)
 
+# query execution, big snapshots are scanned in parallel across a worker pool
+app.state.executor = QueryExecutor(
+    mode=os.getenv("QUERY_MODE", "auto"),
+    workers=int(os.getenv("QUERY_WORKERS", "0")) or None,
+    min_parallel_size=int(os.getenv("QUERY_MIN_PARALLEL_SIZE", "10000"))
+)
+
 # logger
 logger = logging.getLogger(__name__)
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+# additional ticket sources, comma separated
+TICKET_SOURCE_FILES = os.getenv("TICKET_SOURCE_FILES", "")
+TICKET_SOURCE_URLS = os.getenv("TICKET_SOURCE_URLS", "")
+SNAPSHOT_PATH = os.getenv("SNAPSHOT_PATH", "snapshot/tickets.json")
+
+
+def build_sources(db_session_factory) -> List[TicketSource]:
+    sources: List[TicketSource] = [DatabaseSource(db_session_factory)]
+    for path in filter(None, (p.strip() for p in TICKET_SOURCE_FILES.split(","))):
+        sources.append(FileSource(name=f"file:{path}", path=path))
+    for url in filter(None, (u.strip() for u in TICKET_SOURCE_URLS.split(","))):
+        sources.append(HttpSource(name=f"http:{url}", url=url))
+    return sources
 
 
 def get_service(request: Request) -> Service:
     return request.app.state.service
 
 
+def get_executor(request: Request) -> QueryExecutor:
+    return request.app.state.executor
+
+
 def get_db(request: Request) -> Session:
     db = request.app.state.SessionLocal()
     try:
@@ -84,16 +120,15 @@ async def get_tickets(
         per_page: int = Query(10, ge=1, le=100, description="Items per page"),
         status: Optional[Literal["open", "closed"]] = Query(None, description="Filter by status"),
         priority: Optional[Literal["low", "medium", "high"]] = Query(None, description="Filter by priority"),
-        service: Service = Depends(get_service)
+        service: Service = Depends(get_service),
+        executor: QueryExecutor = Depends(get_executor)
 ):
     try:
         all_tickets = await service.get_tickets()
 
         filtered_tickets = all_tickets
-        if status:
-            filtered_tickets = [t for t in filtered_tickets if t.status == status]
-        if priority:
-            filtered_tickets = [t for t in filtered_tickets if t.priority == priority]
+        if status or priority:
+            filtered_tickets = await executor.filter(all_tickets, status=status, priority=priority)
 
         return paginate(filtered_tickets, page, per_page)
 
@@ -115,17 +150,14 @@ async def search_tickets(
         q: str = Query(".", min_length=1, description="Search query"),
         page: int = Query(1, ge=1, description="Page number"),
         per_page: int = Query(10, ge=1, le=100, description="Items per page"),
-        service: Service = Depends(get_service)
+        service: Service = Depends(get_service),
+        executor: QueryExecutor = Depends(get_executor)
 ):
     try:
 
         all_tickets = await service.get_tickets()
 
-        query_lower = q.lower()
-        filtered_tickets = [
-            t for t in all_tickets
-            if query_lower in t.title.lower()
-        ]
+        filtered_tickets = await executor.filter(all_tickets, query=q)
 
         return paginate(filtered_tickets, page, per_page)
 
@@ -158,6 +190,62 @@ async def get_ticket(ticket_id: int,
         raise HTTPException(status_code=HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
+@app.get(
+    "/users",
+    response_model=PaginatedResponse,
+    tags=["Users"],
+    summary="Get paginated list of users with their ticket statistics"
+)
+async def get_users(
+        page: int = Query(1, ge=1, description="Page number"),
+        per_page: int = Query(10, ge=1, le=100, description="Items per page"),
+        service: Service = Depends(get_service)
+):
+    try:
+        users = await service.get_users()
+        return paginate(users, page, per_page)
+
+    except Exception as e:
+        logger.error("Error fetching users")
+        raise HTTPException(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error fetching users: {str(e)}"
+        )
+
+
+@app.get(
+    "/users/{user_id}/tickets",
+    response_model=PaginatedResponse,
+    tags=["Users"],
+    summary="Get paginated list of tickets assigned to a user"
+)
+async def get_user_tickets(
+        user_id: int,
+        page: int = Query(1, ge=1, description="Page number"),
+        per_page: int = Query(10, ge=1, le=100, description="Items per page"),
+        status: Optional[Literal["open", "closed"]] = Query(None, description="Filter by status"),
+        priority: Optional[Literal["low", "medium", "high"]] = Query(None, description="Filter by priority"),
+        service: Service = Depends(get_service),
+        executor: QueryExecutor = Depends(get_executor)
+):
+    try:
+        tickets = await service.get_user_tickets(user_id)
+        if tickets is None:
+            logger.error(f"User not found, ID={user_id}")
+            raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="User not found")
+
+        if status or priority:
+            tickets = await executor.filter(tickets, status=status, priority=priority)
+
+        return paginate(tickets, page, per_page)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching tickets for user, ID={user_id}")
+        raise HTTPException(status_code=HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
 @app.get(
     "/stats",
     response_model=TicketStats,
@@ -8,3 +8,12 @@ class UserModel(Base):
     __tablename__ = 'user'
     id = Column(Integer, primary_key=True)
     username = Column(String(50), unique=True, nullable=False)
+
+
+class TicketModel(Base):
+    __tablename__ = 'ticket'
+    id = Column(Integer, primary_key=True)
+    title = Column(String(255), nullable=False)
+    status = Column(String(10), nullable=False)
+    priority = Column(String(10), nullable=False)
+    assignee = Column(String(50), nullable=True)
@@ -0,0 +1,177 @@
+import asyncio
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple, Callable, Any
+
+from schemas import *
+
+QUERY_MODES = ("auto", "inline", "thread", "process")
+
+# (position in snapshot, lowercase title, status, priority)
+Row = Tuple[int, str, str, str]
+# (priority counts, status counts)
+Counts = Tuple[Dict[str, int], Dict[str, int]]
+
+
+def gil_enabled() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def scan_shard(rows: List[Row], status: Optional[str], priority: Optional[str], query: Optional[str]) -> List[int]:
+    return [
+        position for position, title, row_status, row_priority in rows
+        if (status is None or row_status == status)
+        and (priority is None or row_priority == priority)
+        and (query is None or query in title)
+    ]
+
+
+def empty_counts() -> Counts:
+    return {"low": 0, "medium": 0, "high": 0}, {"open": 0, "closed": 0}
+
+
+def add_count(counts: Counts, status: str, priority: str):
+    counts[0][priority] += 1
+    counts[1][status] += 1
+
+
+def count_shard(rows: List[Row]) -> Counts:
+    counts = empty_counts()
+    for _, _, status, priority in rows:
+        add_count(counts, status, priority)
+    return counts
+
+
+def counts_to_stats(counts: Counts, total: int) -> TicketStats:
+    priority_counts, status_counts = counts
+    return TicketStats(
+        total_tickets=total,
+        priority_breakdown=priority_counts,
+        status_breakdown=status_counts
+    )
+
+
+def merge_counts(parts: List[Counts], total: int) -> TicketStats:
+    merged = empty_counts()
+    for shard_priority, shard_status in parts:
+        for key, count in shard_priority.items():
+            merged[0][key] += count
+        for key, count in shard_status.items():
+            merged[1][key] += count
+    return counts_to_stats(merged, total)
+
+
+# shard resident in a worker process, loaded once per snapshot version
+_resident: Tuple[int, List[Row]] = (-1, [])
+
+
+def load_shard(version: int, rows: List[Row]):
+    global _resident
+    _resident = (version, rows)
+
+
+def run_on_resident_shard(version: int, func: Callable, *args: Any) -> Any:
+    resident_version, rows = _resident
+    if resident_version != version:
+        raise LookupError(f"Shard of snapshot {version} is not loaded, worker holds {resident_version}")
+    return func(rows, *args)
+
+
+def project(tickets: List[Ticket]) -> List[Row]:
+    return [(i, t.title.lower(), t.status, t.priority) for i, t in enumerate(tickets)]
+
+
+class QueryExecutor:
+    """Scatter-gather execution of ticket queries over a sharded snapshot"""
+
+    def __init__(self, mode: str = "auto", workers: Optional[int] = None, min_parallel_size: int = 10000):
+        if mode not in QUERY_MODES:
+            raise ValueError(f"Unknown query mode {mode}, expected one of {QUERY_MODES}")
+        self.mode = mode
+        self.workers = workers or os.cpu_count() or 1
+        # smaller snapshots are scanned inline, the pool round trip costs more than the scan
+        self.min_parallel_size = min_parallel_size
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        # one single-worker pool per shard, so every shard stays resident in its own process
+        self._process_pools: List[ProcessPoolExecutor] = []
+        self._sharded: Optional[Tuple[List[Ticket], int, List[List[Row]]]] = None
+        self._version = 0
+        self._loaded_version = -1
+
+    @property
+    def uses_processes(self) -> bool:
+        return self.mode == "process" or (self.mode == "auto" and gil_enabled())
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(max_workers=self.workers)
+        return self._thread_pool
+
+    def _get_process_pools(self) -> List[ProcessPoolExecutor]:
+        if not self._process_pools:
+            self._process_pools = [ProcessPoolExecutor(max_workers=1) for _ in range(self.workers)]
+        return self._process_pools
+
+    def _split(self, rows: List[Row]) -> List[List[Row]]:
+        size = max(1, -(-len(rows) // self.workers))
+        return [rows[i:i + size] for i in range(0, len(rows), size)]
+
+    async def _shards(self, tickets: List[Ticket]) -> Tuple[int, List[List[Row]]]:
+        # snapshots are never mutated, so shards are rebuilt only for a new snapshot
+        if self._sharded is None or self._sharded[0] is not tickets:
+            rows = await asyncio.to_thread(project, tickets)
+            self._version += 1
+            self._sharded = (tickets, self._version, self._split(rows))
+        return self._sharded[1], self._sharded[2]
+
+    async def _scatter_processes(self, version: int, shards: List[List[Row]], func: Callable, *args: Any) -> List[Any]:
+        loop = asyncio.get_running_loop()
+        pools = self._get_process_pools()
+
+        # rows cross the process boundary once per snapshot, queries only send the predicate
+        if self._loaded_version != version:
+            await asyncio.gather(*(loop.run_in_executor(pool, load_shard, version, shard)
+                                   for pool, shard in zip(pools, shards)))
+            self._loaded_version = version
+
+        return await asyncio.gather(*(loop.run_in_executor(pool, run_on_resident_shard, version, func, *args)
+                                      for pool, _ in zip(pools, shards)))
+
+    async def _scatter(self, tickets: List[Ticket], func: Callable, *args: Any) -> List[Any]:
+        # small lists are scanned inline and never replace the sharded snapshot
+        if len(tickets) < self.min_parallel_size:
+            return [func(project(tickets), *args)]
+
+        version, shards = await self._shards(tickets)
+        if self.mode == "inline":
+            return [func(shard, *args) for shard in shards]
+        if self.uses_processes:
+            try:
+                return await self._scatter_processes(version, shards, func, *args)
+            except LookupError:
+                # a newer snapshot was loaded while this query was running, scan its own shards off the loop
+                return await asyncio.to_thread(lambda: [func(shard, *args) for shard in shards])
+
+        loop = asyncio.get_running_loop()
+        pool = self._get_thread_pool()
+        return await asyncio.gather(*(loop.run_in_executor(pool, func, shard, *args) for shard in shards))
+
+    async def filter(self, tickets: List[Ticket], status: Optional[str] = None, priority: Optional[str] = None,
+                     query: Optional[str] = None) -> List[Ticket]:
+        parts = await self._scatter(tickets, scan_shard, status, priority, query.lower() if query else None)
+        return [tickets[position] for part in parts for position in part]
+
+    async def stats(self, tickets: List[Ticket]) -> TicketStats:
+        parts = await self._scatter(tickets, count_shard)
+        return merge_counts(parts, len(tickets))
+
+    def shutdown(self):
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False, cancel_futures=True)
+            self._thread_pool = None
+        for pool in self._process_pools:
+            pool.shutdown(wait=False, cancel_futures=True)
+        self._process_pools = []
+        self._loaded_version = -1
@@ -0,0 +1,94 @@
+import asyncio
+import time
+from collections import deque
+from typing import Optional, Callable, Awaitable, TypeVar
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream that is known to be unhealthy"""
+
+
+class CircuitBreaker:
+    """Fails fast after repeated upstream failures, probing again after `reset_timeout` seconds"""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at < self.reset_timeout:
+            return "open"
+        return "half-open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        # a single probe request decides whether the circuit closes again
+        if state == "half-open" and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+
+    def release(self):
+        self._probing = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self._probing or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+        self._probing = False
+
+
+class LatencyTracker:
+    """Sliding window of call latencies"""
+
+    def __init__(self, window: int = 100, min_samples: int = 10):
+        self.samples = deque(maxlen=window)
+        self.min_samples = min_samples
+
+    def record(self, seconds: float):
+        self.samples.append(seconds)
+
+    def percentile(self, p: float) -> Optional[float]:
+        if len(self.samples) < self.min_samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+
+async def hedged(call: Callable[[], Awaitable[T]], delay: Optional[float]) -> T:
+    """Awaits `call`, starting a duplicate when the first attempt is slower than `delay` seconds"""
+    pending = {asyncio.ensure_future(call())}
+    error: Optional[BaseException] = None
+    # attempts still running are cancelled on every exit, including cancellation of the caller
+    try:
+        if delay is not None:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return done.pop().result()
+            pending.add(asyncio.ensure_future(call()))
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
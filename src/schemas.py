@@ -27,3 +27,9 @@ class TicketStats(BaseModel):
     total_tickets: int
     priority_breakdown: Dict[str, int]
     status_breakdown: Dict[str, int]
+
+
+class UserStats(BaseModel):
+    id: int
+    username: str
+    stats: TicketStats
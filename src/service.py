@@ -1,9 +1,15 @@
+import time
+
 import httpx
 from typing import List, Any
 from schemas import *
 import logging
 from aiocache import cached, Cache
 from models import *
+from sources import SourceRegistry, TicketSource, DummyJsonSource
+from query import QueryExecutor
+from snapshot import SnapshotStore
+from resilience import CircuitBreaker, CircuitOpenError, LatencyTracker, hedged
 
 logger = logging.getLogger()
 
@@ -12,19 +18,72 @@ class Service:
     """Service for users and tickets"""
 
     BASE_URL = "https://dummyjson.com"
-
-    def __init__(self, db_session_factory):
-        self.client = httpx.AsyncClient()
+    # upstream calls slower than this latency percentile get a hedged duplicate request
+    HEDGE_PERCENTILE = 0.95
+    # seconds a single upstream request may take, below the dummyjson source timeout
+    REQUEST_TIMEOUT = 4
+
+    def __init__(self, db_session_factory, sources: Optional[List[TicketSource]] = None,
+                 executor: Optional[QueryExecutor] = None, store: Optional[SnapshotStore] = None):
+        self.client = httpx.AsyncClient(timeout=self.REQUEST_TIMEOUT)
         self.db_session_factory = db_session_factory
+        self.executor = executor or QueryExecutor()
+        self.breaker = CircuitBreaker()
+        self.latency = LatencyTracker()
+        self._last_users: Dict[int, User] = {}
+        self._last_todos: List[Any] = []
+        self.sources = SourceRegistry(store=store)
+        self.sources.register(DummyJsonSource(self))
+        for source in sources or []:
+            self.sources.register(source)
+
+    async def _request(self, path: str) -> httpx.Response:
+        # error statuses fail the attempt, so a fast 5xx never wins over a slower hedged success
+        response = await self.client.get(f"{self.BASE_URL}{path}")
+        response.raise_for_status()
+        return response
+
+    async def _get(self, path: str) -> Any:
+        if not self.breaker.allow():
+            raise CircuitOpenError(f"Upstream {self.BASE_URL} is unhealthy")
+
+        started = time.monotonic()
+        try:
+            response = await hedged(lambda: self._request(path), self.latency.percentile(self.HEDGE_PERCENTILE))
+        except httpx.HTTPStatusError as e:
+            # client errors such as unknown IDs do not mean the upstream is unhealthy
+            if e.response.status_code < 500:
+                self.breaker.record_success()
+            else:
+                self.breaker.record_failure()
+            raise
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        except BaseException:
+            # a cancelled call says nothing about the upstream, the next call may probe again
+            self.breaker.release()
+            raise
+
+        self.latency.record(time.monotonic() - started)
+        self.breaker.record_success()
+        return response.json()
 
-    @cached(ttl=60, cache=Cache.MEMORY)
     async def fetch_users(self) -> Dict[int, User]:
+        try:
+            return await self._fetch_users()
+        except Exception as e:
+            logger.error(f"Error fetching users: {e}")
+            # the last known good users are served but never cached
+            return self._last_users
+
+    @cached(ttl=60, cache=Cache.MEMORY)
+    async def _fetch_users(self) -> Dict[int, User]:
+        data = await self._get("/users")
+
         db = self.db_session_factory()
         users = {}
         try:
-            response = await self.client.get(f"{self.BASE_URL}/users")
-            response.raise_for_status()
-            data = response.json()
             for user_data in data.get("users", []):
                 user = User(**user_data)
                 users[user.id] = user
@@ -33,26 +92,35 @@ class Service:
             db.commit()
         except Exception as e:
             db.rollback()
-            logger.error(f"Error fetching users: {e}")
-            return {}
+            logger.error(f"Error storing users: {e}")
         finally:
             db.close()
-            return users
 
-    @cached(ttl=60, cache=Cache.MEMORY)
+        if users:
+            self._last_users = users
+        return users
+
     async def fetch_todos(self) -> List[Any]:
         try:
-            response = await self.client.get(f"{self.BASE_URL}/todos")
-            response.raise_for_status()
-            data = response.json()
-            return data.get("todos", [])
+            return await self._fetch_todos()
         except Exception as e:
             logger.error(f"Error fetching todos: {e}")
-            return []
+            return self._last_todos
+
+    @cached(ttl=60, cache=Cache.MEMORY)
+    async def _fetch_todos(self) -> List[Any]:
+        data = await self._get("/todos")
+
+        todos = data.get("todos", [])
+        if todos:
+            self._last_todos = todos
+        return todos
 
     async def transform_todo_to_ticket(self, todo: Dict[str, Any]) -> Ticket:
         users = await self.fetch_users()
+        return self.build_ticket(todo, users)
 
+    def build_ticket(self, todo: Dict[str, Any], users: Dict[int, User]) -> Ticket:
         assignee = None
         if todo.get("userId") and todo["userId"] in users:
             user = users[(todo["userId"])]
@@ -64,41 +132,30 @@ class Service:
         return Ticket(id=todo["id"], title=todo["todo"], status=status, priority=priority, assignee=assignee)
 
     async def get_tickets(self) -> List[Ticket]:
-        todos = await self.fetch_todos()
-        tickets = []
-        for todo in todos:
-            try:
-                ticket = await self.transform_todo_to_ticket(todo)
-                tickets.append(ticket)
-            except Exception as e:
-                logger.error(f"Error transforming todo: {e}")
-                continue
-
-        return tickets
+        return await self.sources.collect()
 
     async def get_ticket(self, ticket_id: id) -> Optional[Ticket]:
         try:
-            response = await self.client.get(f"{self.BASE_URL}/todos/{ticket_id}")
-            response.raise_for_status()
-            todo = response.json()
+            todo = await self._get(f"/todos/{ticket_id}")
             return await self.transform_todo_to_ticket(todo)
         except Exception as e:
             logger.error(f"Error fetching ticket {ticket_id}: {e}")
-            return None
-
-    async def calculate_stats(self, tickets: List[Ticket]) -> TicketStats:
-        total = len(tickets)
-        open_count = sum(1 for t in tickets if t.status == "open")
-        closed_count = total - open_count
+            # fall back to the last snapshot, which also holds tickets from other sources
+            return self.sources.snapshot.by_id.get(ticket_id)
 
-        priority_counts = {"low": 0, "medium": 0, "high": 0}
-        for ticket in tickets:
-            priority_counts[ticket.priority] += 1
+    async def get_users(self) -> List[UserStats]:
+        await self.sources.collect()
+        return self.sources.snapshot.user_stats
 
-        status_counts = {"open": open_count, "closed": closed_count}
+    async def get_user_tickets(self, user_id: int) -> Optional[List[Ticket]]:
+        await self.sources.collect()
+        snapshot = self.sources.snapshot
+        if user_id not in snapshot.users_by_id:
+            return None
+        return snapshot.user_tickets(user_id)
 
-        return TicketStats(
-            total_tickets=total,
-            priority_breakdown=priority_counts,
-            status_breakdown=status_counts
-        )
+    async def calculate_stats(self, tickets: List[Ticket]) -> TicketStats:
+        # stats of the current snapshot are precomputed when it is built
+        if tickets is self.sources.snapshot.tickets:
+            return self.sources.snapshot.stats
+        return await self.executor.stats(tickets)
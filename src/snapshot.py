@@ -0,0 +1,102 @@
+import logging
+import os
+import threading
+import time
+from typing import List, Dict, Optional, Tuple
+
+import orjson
+
+from schemas import *
+from query import empty_counts, add_count, counts_to_stats
+
+logger = logging.getLogger()
+
+
+class TicketSnapshot:
+    """Merged tickets and users with their indexes and stats, built once per refresh off the event loop"""
+
+    def __init__(self, tickets: List[Ticket], users: Optional[List[User]] = None):
+        self.tickets = tickets
+        self.by_id: Dict[int, Ticket] = {}
+        self.users = sorted(users or [], key=lambda u: u.id)
+        self.users_by_id: Dict[int, User] = {u.id: u for u in self.users}
+        self.tickets_by_user: Dict[int, List[int]] = {u.id: [] for u in self.users}
+
+        # one pass indexes tickets, joins them to users by assignee username and counts both
+        user_ids = {u.username: u.id for u in self.users}
+        counts = empty_counts()
+        user_counts = {u.id: empty_counts() for u in self.users}
+        for ticket in tickets:
+            self.by_id[ticket.id] = ticket
+            add_count(counts, ticket.status, ticket.priority)
+            user_id = user_ids.get(ticket.assignee)
+            if user_id is not None:
+                self.tickets_by_user[user_id].append(ticket.id)
+                add_count(user_counts[user_id], ticket.status, ticket.priority)
+
+        self.stats = counts_to_stats(counts, len(tickets))
+        self.user_stats: List[UserStats] = [
+            UserStats(id=u.id, username=u.username,
+                      stats=counts_to_stats(user_counts[u.id], len(self.tickets_by_user[u.id])))
+            for u in self.users
+        ]
+
+    def user_tickets(self, user_id: int) -> List[Ticket]:
+        return [self.by_id[ticket_id] for ticket_id in self.tickets_by_user.get(user_id, [])]
+
+
+class SnapshotStore:
+    """Snapshot persisted to a local file so restarted processes serve data immediately"""
+
+    VERSION = 3
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def save(self, results: Dict[str, List[Ticket]], users: Dict[str, List[User]]):
+        data = orjson.dumps({
+            "version": self.VERSION,
+            "saved_at": time.time(),
+            "sources": {name: [t.model_dump() for t in tickets] for name, tickets in results.items()},
+            "users": {name: [u.model_dump() for u in source_users] for name, source_users in users.items()},
+        })
+
+        # written next to the target and renamed, so readers never see a partial file
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with self._lock:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+
+    def load(self) -> Optional[Tuple[Dict[str, List[Ticket]], Dict[str, List[User]]]]:
+        # the file is a disposable cache, anything unexpected in it is ignored
+        try:
+            with open(self.path, "rb") as f:
+                data = orjson.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Error loading snapshot from {self.path}: {e}")
+            return None
+
+        try:
+            if data.get("version") != self.VERSION:
+                logger.warning(f"Ignoring snapshot {self.path} with version {data.get('version')}")
+                return None
+
+            results = {
+                name: [Ticket.model_validate(record) for record in records]
+                for name, records in data["sources"].items()
+            }
+            users = {
+                name: [User.model_validate(record) for record in records]
+                for name, records in data["users"].items()
+            }
+        except Exception as e:
+            logger.error(f"Ignoring malformed snapshot {self.path}: {e}")
+            return None
+        return results, users
@@ -0,0 +1,336 @@
+import asyncio
+import json
+import logging
+import time
+from typing import List, Any, Dict, Optional
+
+import httpx
+
+from schemas import *
+from models import *
+from snapshot import TicketSnapshot, SnapshotStore
+
+logger = logging.getLogger()
+
+
+class TicketSource:
+    """Base class for ticket source adapters"""
+
+    # seconds a successful result is reused before the source is asked again
+    ttl: float = 60
+    # seconds the request path waits for the first result of a source
+    timeout: float = 5
+    # seconds a failed source is left alone before it is asked again
+    retry_interval: float = 30
+
+    def __init__(self, name: str):
+        self.name = name
+
+    async def fetch_tickets(self) -> List[Ticket]:
+        raise NotImplementedError
+
+    async def fetch_users(self) -> List[User]:
+        return []
+
+    async def close(self):
+        pass
+
+
+def records_to_tickets(source_name: str, records: List[Dict[str, Any]]) -> List[Ticket]:
+    tickets = []
+    for record in records:
+        try:
+            tickets.append(Ticket(**record))
+        except Exception as e:
+            logger.error(f"Error parsing ticket from source {source_name}: {e}")
+            continue
+    return tickets
+
+
+class DummyJsonSource(TicketSource):
+    """Todos from dummyjson mapped to tickets by the service"""
+
+    def __init__(self, service, name: str = "dummyjson"):
+        super().__init__(name)
+        self.service = service
+
+    async def fetch_tickets(self) -> List[Ticket]:
+        todos = await self.service.fetch_todos()
+        # the service logs upstream errors and returns no todos, keep serving the last result instead
+        if not todos:
+            raise RuntimeError("No todos fetched from dummyjson")
+        users = await self.service.fetch_users()
+        tickets = []
+        for todo in todos:
+            try:
+                ticket = self.service.build_ticket(todo, users)
+                tickets.append(ticket)
+            except Exception as e:
+                logger.error(f"Error transforming todo: {e}")
+                continue
+
+        return tickets
+
+    async def fetch_users(self) -> List[User]:
+        users = await self.service.fetch_users()
+        if not users:
+            raise RuntimeError("No users fetched from dummyjson")
+        return list(users.values())
+
+
+class HttpSource(TicketSource):
+    """HTTP API returning ticket records, either as a list or under `items_key`"""
+
+    # seconds a single request may take, below `timeout` so a hanging API fails before the caller gives up
+    request_timeout: float = 4
+
+    def __init__(self, name: str, url: str, items_key: str = "tickets", client: Optional[httpx.AsyncClient] = None):
+        super().__init__(name)
+        self.url = url
+        self.items_key = items_key
+        # a shared client is owned and closed by the caller
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(timeout=self.request_timeout)
+
+    async def fetch_tickets(self) -> List[Ticket]:
+        response = await self.client.get(self.url)
+        response.raise_for_status()
+        data = response.json()
+        records = data if isinstance(data, list) else data.get(self.items_key, [])
+        return records_to_tickets(self.name, records)
+
+    async def close(self):
+        if self._owns_client:
+            await self.client.aclose()
+
+
+class FileSource(TicketSource):
+    """Local JSON or NDJSON (`.ndjson`, `.jsonl`) file with ticket records"""
+
+    def __init__(self, name: str, path: str, items_key: str = "tickets"):
+        super().__init__(name)
+        self.path = path
+        self.items_key = items_key
+
+    def _read_records(self) -> List[Dict[str, Any]]:
+        with open(self.path, encoding="utf-8") as f:
+            if self.path.endswith((".ndjson", ".jsonl")):
+                return [json.loads(line) for line in f if line.strip()]
+            data = json.load(f)
+        return data if isinstance(data, list) else data.get(self.items_key, [])
+
+    async def fetch_tickets(self) -> List[Ticket]:
+        records = await asyncio.to_thread(self._read_records)
+        return records_to_tickets(self.name, records)
+
+
+class DatabaseSource(TicketSource):
+    """Tickets stored in the `ticket` table"""
+
+    def __init__(self, db_session_factory, name: str = "database"):
+        super().__init__(name)
+        self.db_session_factory = db_session_factory
+
+    def _read_records(self) -> List[Dict[str, Any]]:
+        db = self.db_session_factory()
+        try:
+            return [
+                {"id": row.id, "title": row.title, "status": row.status,
+                 "priority": row.priority, "assignee": row.assignee}
+                for row in db.query(TicketModel).order_by(TicketModel.id).all()
+            ]
+        finally:
+            db.close()
+
+    async def fetch_tickets(self) -> List[Ticket]:
+        records = await asyncio.to_thread(self._read_records)
+        return records_to_tickets(self.name, records)
+
+    def _read_users(self) -> List[User]:
+        db = self.db_session_factory()
+        try:
+            return [User(id=row.id, username=row.username)
+                    for row in db.query(UserModel).order_by(UserModel.id).all()]
+        finally:
+            db.close()
+
+    async def fetch_users(self) -> List[User]:
+        return await asyncio.to_thread(self._read_users)
+
+
+class SourceRegistry:
+    """Registered ticket sources, ingested concurrently and merged into one snapshot"""
+
+    def __init__(self, store: Optional[SnapshotStore] = None):
+        self.sources: List[TicketSource] = []
+        self.store = store
+        self.snapshot = TicketSnapshot([])
+        self._results: Dict[str, List[Ticket]] = {}
+        self._users: Dict[str, List[User]] = {}
+        self._fetched_at: Dict[str, float] = {}
+        self._failed_at: Dict[str, float] = {}
+        self._refreshes: Dict[str, asyncio.Task] = {}
+        self._merged_from: List[Optional[List[Ticket]]] = []
+        # snapshots are built off the event loop, only a build newer than the current one is applied
+        self._builds = 0
+        self._applied = 0
+        self._saving: Optional[asyncio.Task] = None
+
+    @property
+    def tickets(self) -> List[Ticket]:
+        return self.snapshot.tickets
+
+    def register(self, source: TicketSource) -> TicketSource:
+        if any(s.name == source.name for s in self.sources):
+            raise ValueError(f"Ticket source {source.name} is already registered")
+        self.sources.append(source)
+        return source
+
+    async def restore(self) -> bool:
+        """Serves the persisted snapshot until sources are refreshed"""
+        loaded = await asyncio.to_thread(self.store.load) if self.store else None
+        if loaded is None:
+            return False
+
+        results, users = loaded
+        now = time.monotonic()
+        for source in self.sources:
+            if source.name in results:
+                self._results[source.name] = results[source.name]
+                self._fetched_at[source.name] = now
+            if source.name in users:
+                self._users[source.name] = users[source.name]
+
+        await self._rebuild(save=False)
+        logger.info(f"Restored snapshot with {len(self.snapshot.tickets)} tickets")
+        return True
+
+    async def refresh(self) -> List[Ticket]:
+        """Fetches every source regardless of its ttl"""
+        await asyncio.gather(*(self._start_refresh(s) for s in self.sources))
+        return await self.collect()
+
+    async def join(self):
+        """Waits for refreshes and snapshot saves running in the background"""
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(t for t in self._refreshes.values() if t.get_loop() is loop))
+        if self._saving is not None and self._saving.get_loop() is loop:
+            await self._saving
+
+    async def close(self):
+        for task in self._refreshes.values():
+            task.cancel()
+        if self._saving is not None:
+            await self._saving
+        await asyncio.gather(*(s.close() for s in self.sources))
+
+    async def _refresh(self, source: TicketSource) -> Optional[List[Ticket]]:
+        tickets, users = await asyncio.gather(source.fetch_tickets(), source.fetch_users(), return_exceptions=True)
+        if isinstance(tickets, BaseException):
+            self._failed_at[source.name] = time.monotonic()
+            logger.error(f"Error fetching tickets from source {source.name}: {tickets}")
+            return None
+        # users only enrich the snapshot, a failure keeps the last users of the source
+        if isinstance(users, BaseException):
+            logger.error(f"Error fetching users from source {source.name}: {users}")
+        else:
+            self._users[source.name] = users
+        self._results[source.name] = tickets
+        self._fetched_at[source.name] = time.monotonic()
+        self._failed_at.pop(source.name, None)
+        return tickets
+
+    def _start_refresh(self, source: TicketSource) -> asyncio.Task:
+        # a running refresh is shared, so concurrent callers never fetch a source twice
+        task = self._refreshes.get(source.name)
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._refresh(source))
+            self._refreshes[source.name] = task
+        return task
+
+    async def _collect_source(self, source: TicketSource) -> Optional[List[Ticket]]:
+        last = self._results.get(source.name)
+        now = time.monotonic()
+        if last is not None and now - self._fetched_at[source.name] < source.ttl:
+            return last
+
+        failed_at = self._failed_at.get(source.name)
+        if failed_at is not None and now - failed_at < source.retry_interval:
+            return last
+
+        # a refresh keeps running in the background when the caller stops waiting for it
+        task = self._start_refresh(source)
+
+        # stale results are served right away while the refresh runs
+        if last is not None:
+            return last
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), source.timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Ticket source {source.name} timed out")
+            return None
+
+    @classmethod
+    def _build(cls, results: List[Optional[List[Ticket]]], users: List[User]) -> TicketSnapshot:
+        return TicketSnapshot(cls._merge(results), users)
+
+    @staticmethod
+    def _merge(results: List[Optional[List[Ticket]]]) -> List[Ticket]:
+        merged = []
+        seen = set()
+        for tickets in results:
+            for ticket in tickets or []:
+                if ticket.id in seen:
+                    continue
+                seen.add(ticket.id)
+                merged.append(ticket)
+        return merged
+
+    def _merge_users(self) -> List[User]:
+        users = {}
+        for source in self.sources:
+            for user in self._users.get(source.name, []):
+                users.setdefault(user.id, user)
+        return list(users.values())
+
+    async def _save(self, previous: Optional[asyncio.Task], build: int,
+                    results: Dict[str, List[Ticket]], users: Dict[str, List[User]]):
+        # saves run one at a time, and a save superseded by a newer snapshot is dropped
+        if previous is not None and previous.get_loop() is asyncio.get_running_loop():
+            await asyncio.wait([previous])
+        if build != self._applied:
+            return
+        try:
+            await asyncio.to_thread(self.store.save, results, users)
+        except Exception as e:
+            logger.error(f"Error saving snapshot to {self.store.path}: {e}")
+
+    async def _rebuild(self, save: bool = True):
+        self._builds += 1
+        build = self._builds
+        results = [self._results.get(s.name) for s in self.sources]
+        users = dict(self._users)
+
+        snapshot = await asyncio.to_thread(self._build, results, self._merge_users())
+        if build < self._applied:
+            return
+        self._applied = build
+        self._merged_from = results
+        self.snapshot = snapshot
+
+        if save and self.store is not None:
+            saved = {s.name: r for s, r in zip(self.sources, results) if r is not None}
+            self._saving = asyncio.create_task(self._save(self._saving, build, saved, users))
+
+    async def collect(self) -> List[Ticket]:
+        await asyncio.gather(*(self._collect_source(s) for s in self.sources))
+
+        # the snapshot is reused while no source has produced new results
+        results = [self._results.get(s.name) for s in self.sources]
+        if len(results) == len(self._merged_from) and all(
+                r is m for r, m in zip(results, self._merged_from)):
+            return self.snapshot.tickets
+
+        await self._rebuild()
+        return self.snapshot.tickets
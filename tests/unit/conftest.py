@@ -0,0 +1,24 @@
+import asyncio
+
+from sources import TicketSource
+
+
+class StaticSource(TicketSource):
+
+    def __init__(self, name, tickets, users=None, delay=0, fail=False):
+        super().__init__(name)
+        self.tickets = tickets
+        self.users = users or []
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    async def fetch_tickets(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("source is down")
+        return self.tickets
+
+    async def fetch_users(self):
+        return self.users
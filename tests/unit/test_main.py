@@ -3,7 +3,7 @@ import pytest
 from fastapi.testclient import TestClient
 from main import app, Base, get_db
 from service import Service
-from schemas import Ticket, TicketStats
+from schemas import Ticket, TicketStats, UserStats
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
@@ -145,3 +145,50 @@ class TestStatsEndpoints:
         assert data["priority_breakdown"]["high"] == 1
         assert data["priority_breakdown"]["medium"] == 1
         assert data["priority_breakdown"]["low"] == 0
+
+
+class TestUserEndpoints:
+
+    def test_get_users(self, client):
+        test_client, mock_service = client
+        mock_service.get_users.return_value = [
+            UserStats(
+                id=1,
+                username="testuser1",
+                stats=TicketStats(
+                    total_tickets=1,
+                    priority_breakdown={"high": 1, "medium": 0, "low": 0},
+                    status_breakdown={"open": 1, "closed": 0}
+                )
+            )
+        ]
+
+        response = test_client.get("/users")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["total"] == 1
+        assert data["items"][0]["username"] == "testuser1"
+        assert data["items"][0]["stats"]["total_tickets"] == 1
+
+    def test_get_user_tickets(self, client, sample_tickets):
+        test_client, mock_service = client
+        mock_service.get_user_tickets.return_value = sample_tickets
+
+        response = test_client.get("/users/1/tickets?status=closed")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["total"] == 1
+        assert data["items"][0]["id"] == 2
+
+        response = test_client.get("/users/1/tickets?status=open&priority=medium")
+        assert response.status_code == 200
+        assert response.json()["total"] == 0
+
+    def test_get_user_tickets_not_found(self, client):
+        test_client, mock_service = client
+        mock_service.get_user_tickets.return_value = None
+
+        response = test_client.get("/users/999/tickets")
+        assert response.status_code == 404
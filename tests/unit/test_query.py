@@ -0,0 +1,115 @@
+import os
+import time
+
+import pytest
+from unittest.mock import patch
+
+import query
+from schemas import Ticket
+from query import QueryExecutor
+
+
+@pytest.fixture
+def tickets():
+    statuses = ["open", "closed"]
+    priorities = ["low", "medium", "high"]
+    return [
+        Ticket(id=i, title=f"Ticket {i} {'Urgent' if i % 5 == 0 else 'routine'}",
+               status=statuses[i % 2], priority=priorities[i % 3])
+        for i in range(1, 101)
+    ]
+
+
+@pytest.fixture(params=["inline", "thread", "process"])
+def executor(request):
+    executor = QueryExecutor(mode=request.param, workers=4, min_parallel_size=0)
+    yield executor
+    executor.shutdown()
+
+
+class TestQueryExecutor:
+
+    @pytest.mark.asyncio
+    async def test_filter(self, executor, tickets):
+        result = await executor.filter(tickets, status="open", priority="high")
+
+        expected = [t for t in tickets if t.status == "open" and t.priority == "high"]
+        assert [t.id for t in result] == [t.id for t in expected]
+
+    @pytest.mark.asyncio
+    async def test_search(self, executor, tickets):
+        result = await executor.filter(tickets, query="URGENT")
+
+        assert [t.id for t in result] == [i for i in range(1, 101) if i % 5 == 0]
+
+    @pytest.mark.asyncio
+    async def test_stats(self, executor, tickets):
+        stats = await executor.stats(tickets)
+
+        assert stats.total_tickets == 100
+        assert stats.status_breakdown == {"open": 50, "closed": 50}
+        assert stats.priority_breakdown == {"low": 33, "medium": 34, "high": 33}
+
+    @pytest.mark.asyncio
+    async def test_empty_snapshot(self, executor):
+        stats = await executor.stats([])
+
+        assert stats.total_tickets == 0
+        assert await executor.filter([], status="open") == []
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            QueryExecutor(mode="gpu")
+
+    @pytest.mark.asyncio
+    async def test_snapshot_is_sharded_once(self, tickets):
+        executor = QueryExecutor(mode="process", workers=2, min_parallel_size=0)
+        try:
+            with patch("query.project", wraps=query.project) as project:
+                await executor.filter(tickets, status="open")
+                await executor.filter(tickets, query="urgent")
+                await executor.stats(tickets)
+                assert project.call_count == 1
+
+                # a new snapshot is sharded and loaded into the workers once
+                newer = tickets[:50]
+                result = await executor.filter(newer, status="open")
+                await executor.filter(newer, priority="high")
+                assert project.call_count == 2
+                assert [t.id for t in result] == [t.id for t in newer if t.status == "open"]
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_small_lists_keep_snapshot_shards(self, tickets):
+        executor = QueryExecutor(mode="inline", min_parallel_size=50)
+
+        with patch("query.project", wraps=query.project) as project:
+            await executor.filter(tickets, status="open")
+            await executor.filter(tickets[:10], status="open")
+            await executor.filter(tickets, status="closed")
+
+        # the small list is projected inline, the snapshot shards are reused
+        assert project.call_count == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not os.getenv("RUN_BENCHMARKS"), reason="benchmark, set RUN_BENCHMARKS=1 to run")
+    async def test_process_mode_beats_inline(self):
+        tickets = [
+            Ticket.model_construct(id=i, title=f"Ticket {i} {'urgent' if i % 7 == 0 else 'routine'}",
+                                   status=("open", "closed")[i % 2], priority=("low", "medium", "high")[i % 3])
+            for i in range(200000)
+        ]
+
+        async def per_query(executor):
+            await executor.filter(tickets, query="urgent")
+            started = time.perf_counter()
+            for _ in range(10):
+                await executor.filter(tickets, status="open", query="urgent")
+            executor.shutdown()
+            return (time.perf_counter() - started) / 10
+
+        inline = await per_query(QueryExecutor(mode="inline", min_parallel_size=0))
+        process = await per_query(QueryExecutor(mode="process", workers=4, min_parallel_size=0))
+
+        assert process < inline
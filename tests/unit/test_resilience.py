@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from resilience import CircuitBreaker, LatencyTracker, hedged
+
+
+class TestCircuitBreaker:
+
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+        breaker.record_failure()
+        assert breaker.allow()
+
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert not breaker.allow()
+
+    def test_half_open_probe(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+
+        assert breaker.state == "half-open"
+        assert breaker.allow()
+        # only one probe at a time
+        assert not breaker.allow()
+
+        breaker.record_success()
+        assert breaker.state == "closed"
+        assert breaker.allow()
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=0)
+        for _ in range(3):
+            breaker.record_failure()
+
+        assert breaker.allow()
+        breaker.reset_timeout = 60
+        breaker.record_failure()
+        assert breaker.state == "open"
+
+
+class TestLatencyTracker:
+
+    def test_percentile(self):
+        tracker = LatencyTracker(window=100, min_samples=10)
+        assert tracker.percentile(0.95) is None
+
+        for i in range(1, 101):
+            tracker.record(i / 100)
+
+        assert tracker.percentile(0.95) == 0.96
+        assert tracker.percentile(0.5) == 0.51
+
+
+class TestHedged:
+
+    @pytest.mark.asyncio
+    async def test_fast_call_is_not_hedged(self):
+        calls = []
+
+        async def call():
+            calls.append(1)
+            return "ok"
+
+        assert await hedged(call, 0.1) == "ok"
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_call_is_hedged(self):
+        delays = [1, 0]
+
+        async def call():
+            await asyncio.sleep(delays.pop(0))
+            return "ok"
+
+        assert await asyncio.wait_for(hedged(call, 0.01), 0.5) == "ok"
+        assert delays == []
+
+    @pytest.mark.asyncio
+    async def test_all_attempts_fail(self):
+        async def call():
+            await asyncio.sleep(0.02)
+            raise RuntimeError("upstream down")
+
+        with pytest.raises(RuntimeError):
+            await hedged(call, 0.01)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_cancels_attempts(self):
+        started = []
+
+        async def call():
+            started.append(asyncio.current_task())
+            await asyncio.sleep(10)
+
+        caller = asyncio.ensure_future(hedged(call, 1))
+        await asyncio.sleep(0.01)
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.sleep(0)
+
+        assert len(started) == 1
+        assert started[0].cancelled()
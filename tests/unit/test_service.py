@@ -1,3 +1,6 @@
+import asyncio
+
+import httpx
 import pytest
 
 from schemas import User, Ticket
@@ -197,3 +200,142 @@ class TestService:
         assert stats.priority_breakdown["low"] == 1
         assert stats.status_breakdown["open"] == 2
         assert stats.status_breakdown["closed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_todos_error_is_not_cached(self, service, sample_todos):
+        mock = MagicMock()
+        mock.json.return_value = sample_todos
+        mock.raise_for_status.return_value = None
+
+        with patch.object(service.client, 'get', side_effect=httpx.ConnectError("down")):
+            assert await service.fetch_todos() == []
+
+        with patch.object(service.client, 'get', return_value=mock):
+            todos = await service.fetch_todos()
+            assert len(todos) == 2
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_serves_last_known_good(self, service, sample_todos):
+        mock = MagicMock()
+        mock.json.return_value = sample_todos
+        mock.raise_for_status.return_value = None
+
+        with patch.object(service.client, 'get', return_value=mock):
+            await service.fetch_todos()
+        await service._fetch_todos.cache.clear()
+
+        for _ in range(service.breaker.failure_threshold):
+            service.breaker.record_failure()
+
+        with patch.object(service.client, 'get') as get:
+            todos = await service.fetch_todos()
+            get.assert_not_called()
+
+        assert len(todos) == 2
+
+    @pytest.mark.asyncio
+    async def test_last_known_good_is_not_cached(self, service, sample_todos):
+        mock = MagicMock()
+        mock.json.return_value = sample_todos
+        mock.raise_for_status.return_value = None
+
+        with patch.object(service.client, 'get', return_value=mock):
+            await service.fetch_todos()
+        await service._fetch_todos.cache.clear()
+
+        with patch.object(service.client, 'get', side_effect=httpx.ConnectError("down")):
+            assert len(await service.fetch_todos()) == 2
+
+        recovered = MagicMock()
+        recovered.json.return_value = {"todos": sample_todos["todos"][:1]}
+        recovered.raise_for_status.return_value = None
+
+        with patch.object(service.client, 'get', return_value=recovered) as get:
+            todos = await service.fetch_todos()
+            get.assert_called_once()
+
+        assert len(todos) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_releases_circuit(self, service):
+        service.breaker.reset_timeout = 0
+        for _ in range(service.breaker.failure_threshold):
+            service.breaker.record_failure()
+
+        async def hang(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        with patch.object(service.client, 'get', side_effect=hang):
+            probe = asyncio.ensure_future(service._get("/todos"))
+            await asyncio.sleep(0)
+            probe.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await probe
+
+        assert service.breaker.state == "half-open"
+        assert service.breaker.allow()
+
+    @pytest.mark.asyncio
+    async def test_hedged_server_error_does_not_win(self, service):
+        for _ in range(service.latency.min_samples):
+            service.latency.record(0.001)
+        request = httpx.Request("GET", f"{Service.BASE_URL}/todos/1")
+        responses = [(0.2, httpx.Response(200, json={"id": 1}, request=request)),
+                     (0, httpx.Response(503, request=request))]
+
+        async def get(*args, **kwargs):
+            delay, response = responses.pop(0)
+            await asyncio.sleep(delay)
+            return response
+
+        with patch.object(service.client, 'get', side_effect=get):
+            assert await service._get("/todos/1") == {"id": 1}
+
+    @pytest.mark.asyncio
+    async def test_get_ticket_not_found_keeps_circuit_closed(self, service):
+        response = httpx.Response(404, request=httpx.Request("GET", f"{Service.BASE_URL}/todos/999"))
+
+        with patch.object(service.client, 'get', return_value=response):
+            for _ in range(service.breaker.failure_threshold):
+                assert await service.get_ticket(999) is None
+
+        assert service.breaker.state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_get_ticket_falls_back_to_snapshot(self, service):
+        todos = _sample_todos()["todos"]
+        users_data = _sample_user_data()
+        users = {1: User(**users_data["users"][0]), 2: User(**users_data["users"][1])}
+        service.fetch_todos = AsyncMock(return_value=todos)
+        service.fetch_users = AsyncMock(return_value=users)
+        await service.get_tickets()
+
+        with patch.object(service.client, 'get', side_effect=httpx.ConnectError("down")):
+            ticket = await service.get_ticket(20)
+
+        assert ticket.id == 20
+        assert ticket.assignee == "testuser1"
+
+    @pytest.mark.asyncio
+    async def test_get_users_and_user_tickets(self, service):
+        todos = _sample_todos()["todos"]
+        users_data = _sample_user_data()
+        users = {1: User(**users_data["users"][0]), 2: User(**users_data["users"][1])}
+        service.fetch_todos = AsyncMock(return_value=todos)
+        service.fetch_users = AsyncMock(return_value=users)
+
+        user_stats = await service.get_users()
+
+        assert [u.username for u in user_stats] == ["testuser1", "testuser2"]
+        assert user_stats[0].stats.total_tickets == 1
+        assert user_stats[0].stats.status_breakdown["closed"] == 1
+        assert user_stats[1].stats.total_tickets == 0
+
+        tickets = await service.get_user_tickets(1)
+        assert [t.id for t in tickets] == [20]
+        assert await service.get_user_tickets(2) == []
+        assert await service.get_user_tickets(999) is None
+
+    def test_client_timeout_is_below_source_timeout(self, service):
+        dummyjson = service.sources.sources[0]
+        assert service.client.timeout.read == Service.REQUEST_TIMEOUT < dummyjson.timeout
@@ -0,0 +1,155 @@
+import os
+
+import orjson
+import pytest
+
+from conftest import StaticSource
+from schemas import Ticket, User
+from snapshot import TicketSnapshot, SnapshotStore
+from sources import SourceRegistry
+
+
+@pytest.fixture
+def tickets():
+    return [
+        Ticket(id=1, title="T1", status="open", priority="high", assignee="u1"),
+        Ticket(id=2, title="T2", status="closed", priority="low"),
+        Ticket(id=3, title="T3", status="open", priority="high"),
+    ]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SnapshotStore(str(tmp_path / "snapshot" / "tickets.json"))
+
+
+class TestSnapshot:
+
+    def test_snapshot_index_and_stats(self, tickets):
+        snapshot = TicketSnapshot(tickets)
+
+        assert snapshot.by_id[3].title == "T3"
+        assert snapshot.stats.total_tickets == 3
+        assert snapshot.stats.priority_breakdown == {"low": 1, "medium": 0, "high": 2}
+        assert snapshot.stats.status_breakdown == {"open": 2, "closed": 1}
+
+    def test_snapshot_user_join(self, tickets):
+        users = [User(id=2, username="u2"), User(id=1, username="u1")]
+        snapshot = TicketSnapshot(tickets + [Ticket(id=4, title="T4", status="closed", priority="low",
+                                                    assignee="u1")], users)
+
+        assert snapshot.tickets_by_user == {1: [1, 4], 2: []}
+        assert [t.id for t in snapshot.user_tickets(1)] == [1, 4]
+        assert snapshot.user_tickets(99) == []
+
+        first, second = snapshot.user_stats
+        assert first.id == 1 and first.username == "u1"
+        assert first.stats.total_tickets == 2
+        assert first.stats.status_breakdown == {"open": 1, "closed": 1}
+        assert second.id == 2
+        assert second.stats.total_tickets == 0
+
+    def test_save_and_load(self, store, tickets):
+        store.save({"a": tickets}, {"a": [User(id=1, username="u1")]})
+
+        results, users = store.load()
+
+        assert results["a"] == tickets
+        assert users["a"] == [User(id=1, username="u1")]
+
+    def test_load_missing_file(self, store):
+        assert store.load() is None
+
+    def test_load_other_version(self, store, tickets):
+        store.save({"a": tickets}, {})
+        with open(store.path, "rb") as f:
+            data = orjson.loads(f.read())
+        data["version"] = SnapshotStore.VERSION + 1
+        with open(store.path, "wb") as f:
+            f.write(orjson.dumps(data))
+
+        assert store.load() is None
+
+    @pytest.mark.asyncio
+    async def test_registry_saves_and_restores(self, store, tickets):
+        registry = SourceRegistry(store=store)
+        registry.register(StaticSource("a", tickets, [User(id=1, username="u1")]))
+        await registry.collect()
+        await registry.join()
+
+        restarted = SourceRegistry(store=store)
+        source = restarted.register(StaticSource("a", []))
+        assert await restarted.restore()
+
+        assert await restarted.collect() == tickets
+        assert restarted.snapshot.stats.total_tickets == 3
+        assert restarted.snapshot.tickets_by_user == {1: [1]}
+        assert source.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_refresh_replaces_restored_snapshot(self, store, tickets):
+        registry = SourceRegistry(store=store)
+        registry.register(StaticSource("a", tickets))
+        await registry.collect()
+        await registry.join()
+
+        restarted = SourceRegistry(store=store)
+        restarted.register(StaticSource("a", tickets[:1]))
+        await restarted.restore()
+
+        assert [t.id for t in await restarted.refresh()] == [1]
+        await restarted.join()
+        results, _ = store.load()
+        assert [t.id for t in results["a"]] == [1]
+
+    @pytest.mark.asyncio
+    async def test_restore_recomputes_stats_for_registered_sources(self, store, tickets):
+        registry = SourceRegistry(store=store)
+        registry.register(StaticSource("a", tickets[:1]))
+        registry.register(StaticSource("b", tickets[1:]))
+        await registry.collect()
+        await registry.join()
+
+        restarted = SourceRegistry(store=store)
+        restarted.register(StaticSource("a", []))
+        await restarted.restore()
+
+        assert len(restarted.snapshot.tickets) == 1
+        assert restarted.snapshot.stats.total_tickets == 1
+        assert restarted.snapshot.stats.priority_breakdown == {"low": 0, "medium": 0, "high": 1}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("content", [
+        b"[]",
+        b"not json",
+        orjson.dumps({"version": SnapshotStore.VERSION}),
+        orjson.dumps({"version": SnapshotStore.VERSION, "sources": {"a": [{"id": 1}]}, "users": {}}),
+        orjson.dumps({"version": SnapshotStore.VERSION, "sources": {"a": {}}, "users": []}),
+    ])
+    async def test_restore_ignores_malformed_file(self, store, content):
+        os.makedirs(os.path.dirname(store.path))
+        with open(store.path, "wb") as f:
+            f.write(content)
+
+        registry = SourceRegistry(store=store)
+        registry.register(StaticSource("a", []))
+
+        assert not await registry.restore()
+        assert registry.snapshot.tickets == []
+
+    @pytest.mark.asyncio
+    async def test_latest_snapshot_is_saved_last(self, store, tickets):
+        registry = SourceRegistry(store=store)
+        source = registry.register(StaticSource("a", tickets))
+        source.ttl = 0
+        source.retry_interval = 0
+
+        await registry.refresh()
+        source.tickets = tickets[:2]
+        await registry.refresh()
+        source.tickets = tickets[:1]
+        await registry.refresh()
+        await registry.close()
+
+        results, _ = store.load()
+        assert [t.id for t in results["a"]] == [1]
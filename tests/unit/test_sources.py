@@ -0,0 +1,194 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from conftest import StaticSource
+from schemas import Ticket
+from sources import SourceRegistry, FileSource, DatabaseSource, HttpSource
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from models import Base, TicketModel, UserModel
+
+TEST_DATABASE_URL = "sqlite:///:memory:"
+
+# the database source reads from a worker thread, so all connections share one in-memory database
+engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False}, poolclass=StaticPool)
+TestingSessionLocal = sessionmaker(bind=engine)
+
+Base.metadata.create_all(bind=engine)
+
+
+def _ticket(ticket_id, title="T"):
+    return Ticket(id=ticket_id, title=title, status="open", priority="low")
+
+
+class TestSources:
+
+    @pytest.mark.asyncio
+    async def test_file_source_json(self, tmp_path):
+        path = tmp_path / "tickets.json"
+        path.write_text(json.dumps({"tickets": [
+            {"id": 1, "title": "From file", "status": "open", "priority": "high"},
+            {"id": 2, "title": "Broken", "status": "unknown", "priority": "high"},
+        ]}))
+
+        tickets = await FileSource(name="file", path=str(path)).fetch_tickets()
+
+        assert len(tickets) == 1
+        assert tickets[0].title == "From file"
+
+    @pytest.mark.asyncio
+    async def test_file_source_ndjson(self, tmp_path):
+        path = tmp_path / "tickets.ndjson"
+        path.write_text(
+            '{"id": 1, "title": "First", "status": "open", "priority": "low"}\n'
+            '\n'
+            '{"id": 2, "title": "Second", "status": "closed", "priority": "medium", "assignee": "u1"}\n'
+        )
+
+        tickets = await FileSource(name="file", path=str(path)).fetch_tickets()
+
+        assert [t.id for t in tickets] == [1, 2]
+        assert tickets[1].assignee == "u1"
+
+    @pytest.mark.asyncio
+    async def test_database_source(self):
+        db = TestingSessionLocal()
+        db.add(TicketModel(id=7, title="Stored", status="closed", priority="medium", assignee="u1"))
+        db.commit()
+        db.close()
+
+        tickets = await DatabaseSource(TestingSessionLocal).fetch_tickets()
+
+        assert len(tickets) == 1
+        assert tickets[0].id == 7
+        assert tickets[0].status == "closed"
+
+    @pytest.mark.asyncio
+    async def test_database_source_users(self):
+        db = TestingSessionLocal()
+        db.add(UserModel(id=3, username="stored"))
+        db.commit()
+        db.close()
+
+        users = await DatabaseSource(TestingSessionLocal).fetch_users()
+
+        assert [(u.id, u.username) for u in users] == [(3, "stored")]
+
+    @pytest.mark.asyncio
+    async def test_collect_merges_and_deduplicates(self):
+        registry = SourceRegistry()
+        registry.register(StaticSource("a", [_ticket(1, "a1"), _ticket(2, "a2")]))
+        registry.register(StaticSource("b", [_ticket(2, "b2"), _ticket(3, "b3")]))
+
+        tickets = await registry.collect()
+
+        assert [t.id for t in tickets] == [1, 2, 3]
+        assert tickets[1].title == "a2"
+
+    @pytest.mark.asyncio
+    async def test_collect_uses_cache(self):
+        registry = SourceRegistry()
+        source = registry.register(StaticSource("a", [_ticket(1)]))
+
+        first = await registry.collect()
+        second = await registry.collect()
+
+        assert source.calls == 1
+        assert first is second
+
+    @pytest.mark.asyncio
+    async def test_failing_source_is_isolated(self):
+        registry = SourceRegistry()
+        failing = registry.register(StaticSource("a", [_ticket(1)]))
+        registry.register(StaticSource("b", [_ticket(2)], fail=True))
+
+        tickets = await registry.collect()
+        assert [t.id for t in tickets] == [1]
+
+        # a source failing after a successful fetch keeps serving its last result
+        failing.ttl = 0
+        failing.fail = True
+        tickets = await registry.collect()
+        assert [t.id for t in tickets] == [1]
+
+    @pytest.mark.asyncio
+    async def test_slow_source_does_not_block(self):
+        registry = SourceRegistry()
+        registry.register(StaticSource("fast", [_ticket(1)]))
+        slow = registry.register(StaticSource("slow", [_ticket(2)], delay=0.2))
+        slow.timeout = 0.01
+
+        tickets = await registry.collect()
+        assert [t.id for t in tickets] == [1]
+
+        # the refresh finishes in the background and is served once ready
+        await asyncio.sleep(0.3)
+        tickets = await registry.collect()
+        assert [t.id for t in tickets] == [1, 2]
+        assert slow.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_result_is_served_while_refreshing(self):
+        registry = SourceRegistry()
+        source = registry.register(StaticSource("a", [_ticket(1)]))
+        await registry.collect()
+
+        source.ttl = 0
+        source.delay = 0.3
+        source.tickets = [_ticket(1), _ticket(2)]
+        tickets = await asyncio.wait_for(registry.collect(), 0.1)
+        assert [t.id for t in tickets] == [1]
+        assert source.calls == 2
+
+        source.delay = 0
+        await registry.join()
+        assert [t.id for t in await registry.collect()] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_collect_shares_running_refresh(self):
+        registry = SourceRegistry()
+        source = registry.register(StaticSource("a", [_ticket(1)], delay=0.05))
+
+        refreshed, collected = await asyncio.gather(registry.refresh(), registry.collect())
+
+        assert [t.id for t in refreshed] == [1]
+        assert [t.id for t in collected] == [1]
+        assert source.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_failing_source_backs_off(self):
+        registry = SourceRegistry()
+        source = registry.register(StaticSource("a", [_ticket(1)], fail=True))
+
+        for _ in range(5):
+            assert await registry.collect() == []
+        assert source.calls == 1
+
+        source.retry_interval = 0
+        source.fail = False
+        await registry.collect()
+        assert source.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_http_source_client(self):
+        source = HttpSource(name="http", url="http://localhost/tickets")
+        assert source.client.timeout.read == HttpSource.request_timeout < source.timeout
+        await source.close()
+        assert source.client.is_closed
+
+        shared = httpx.AsyncClient()
+        source = HttpSource(name="http", url="http://localhost/tickets", client=shared)
+        await source.close()
+        assert not shared.is_closed
+        await shared.aclose()
+
+    def test_register_duplicate_name(self):
+        registry = SourceRegistry()
+        registry.register(StaticSource("a", []))
+
+        with pytest.raises(ValueError):
+            registry.register(StaticSource("a", []))